@@ -3,16 +3,21 @@
 매일 자동으로 뉴스를 모니터링하고 팩트체크 결과를 이메일로 전송
 """
 
+import logging
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
+from concurrent.futures import ProcessPoolExecutor
+from email.message import EmailMessage
 from pathlib import Path
+import string
 import sys
+import unicodedata
 from datetime import datetime
 import os
-from difflib import SequenceMatcher
 from dotenv import load_dotenv
+from rapidfuzz import fuzz
+import requests
+from requests.adapters import HTTPAdapter, Retry
+import jinja2
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -24,10 +29,136 @@ from priority_scorer import PriorityScorer
 # 환경변수 로드
 load_dotenv()
 
+# 리포트 템플릿 (모듈 로드 시 1회 컴파일, autoescape로 제목/주장 HTML 이스케이프)
+_REPORT_TMPL = jinja2.Environment(autoescape=True).from_string("""
+<html>
+<head>
+    <style>
+        body { font-family: 'Malgun Gothic', Arial, sans-serif; line-height: 1.6; }
+        .container { max-width: 800px; margin: 0 auto; padding: 20px; }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; text-align: center; }
+        .summary { background: #f0f0f0; padding: 20px; border-radius: 10px; margin: 20px 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 일일 팩트체크 리포트</h1>
+            <p>{{ now.strftime('%Y년 %m월 %d일 %H:%M') }}</p>
+        </div>
+
+        <div class="summary">
+            <h2>📌 오늘의 요약</h2>
+            <p>
+                <strong>팩트체크 필요 기사:</strong> {{ articles|length }}건<br>
+                <strong>모니터링 상태:</strong> ✅ 정상
+            </p>
+        </div>
+
+        <div style="margin: 20px 0; padding: 15px; background: #fff; border: 1px solid #e1e4e8; border-radius: 8px;">
+            <h3 style="margin-top: 0; margin-bottom: 15px; color: #24292e;">🏆 이달의 팩트체크 기자 (Hall of Fame)</h3>
+            <table style="width: 100%; border-collapse: collapse;">
+                {% for name, aff, count in journalists %}
+                <tr>
+                    <td style="padding: 8px; border-bottom: 1px solid #eee;">{{ medals[loop.index0] if loop.index0 < 3 else loop.index }} <strong>{{ name }}</strong> ({{ aff }})</td>
+                    <td style="padding: 8px; border-bottom: 1px solid #eee; text-align: right;">{{ count }}건</td>
+                </tr>
+                {% else %}
+                <tr>
+                    <td colspan="2" style="padding: 15px; text-align: center; color: #666;">
+                        🌱 아직 데이터가 충분하지 않습니다.<br>
+                        (오늘부터 기자별 통계가 누적되기 시작합니다!)
+                    </td>
+                </tr>
+                {% endfor %}
+            </table>
+        </div>
+
+        <h2>🎯 팩트체크 대상 기사 (최초 보도 우선)</h2>
+        {% for item in articles %}
+        {% set article = item.article %}
+        {% set score = item.score %}
+        <div style="border: 1px solid #ddd; border-radius: 10px; padding: 20px; margin-bottom: 20px; background: #f9f9f9;">
+            <h3 style="margin-top: 0;">[{{ loop.index }}] {{ article.title }}</h3>
+            <p style="color: #666;">
+                <strong>언론사:</strong> {{ article.source }} |
+                <strong>기자:</strong> {{ article.get('journalist', 'Unknown') }} |
+                <strong>발행일:</strong> {{ article.date }}
+            </p>
+            {% if item.get('related_count', 0) > 0 %}
+            <div style="margin-top: 10px; padding: 10px; background: #f1f8ff; border-radius: 5px; font-size: 13px; color: #0366d6;">
+                <strong>🔗 관련 보도 ({{ item.related_count }}건):</strong> {{ item.related_info|join(', ') }} 등
+            </div>
+            {% endif %}
+
+            <div style="background: white; padding: 15px; border-radius: 5px; margin: 10px 0;">
+                <p style="margin: 5px 0;">
+                    <strong>우선순위 점수:</strong>
+                    <span style="color: {{ priority_colors.get(score.priority, '#95a5a6') }}; font-size: 20px; font-weight: bold;">{{ score.total_score }}점</span>
+                    <span style="background: {{ priority_colors.get(score.priority, '#95a5a6') }}; color: white; padding: 3px 8px; border-radius: 3px; margin-left: 10px;">{{ score.priority }}</span>
+                </p>
+                <p style="margin: 5px 0;"><strong>발견된 주장:</strong> {{ score.claims_count }}개</p>
+            </div>
+
+            <h4>🔍 주요 주장</h4>
+            <ul>
+                {% for claim in item.claims[:3] %}
+                <li><strong>[{{ claim_types.get(claim.type, claim.type) }}]</strong> {{ claim.claim[:100] }}...<br><small>신뢰도: {{ claim.confidence }}</small></li>
+                {% endfor %}
+            </ul>
+            <p><a href="{{ item.url }}" style="background: #3498db; color: white; padding: 10px 15px; text-decoration: none; border-radius: 5px; display: inline-block;">원문 보기 →</a></p>
+        </div>
+        {% endfor %}
+
+        <hr style="margin: 30px 0;">
+
+    </div>
+</body>
+</html>
+""")
+
+# 워커 프로세스별 분석기 (프로세스당 1회만 생성)
+_worker_detector = None
+_worker_scorer = None
+
+
+def _analyze_one(article):
+    """기사 1건 CPU 분석 (주장 탐지 + 점수 계산) - 워커 프로세스에서 실행"""
+    global _worker_detector, _worker_scorer
+
+    if _worker_detector is None:
+        _worker_detector = ClaimDetector()
+        _worker_scorer = PriorityScorer()
+
+    claims = _worker_detector.detect(article['text'])
+    has_vague = _worker_detector.has_vague_source(article['text'])
+    score_result = _worker_scorer.calculate_score(article, claims, has_vague)
+
+    return claims, score_result
+
+
+# 표시용 상수
+_CLAIM_TYPE_LABELS = {
+    'statistical': '📊 통계',
+    'causal': '🔗 인과관계',
+    'extreme': '⚠️ 극단 표현'
+}
+_PRIORITY_COLORS = {'HIGH': '#e74c3c', 'MEDIUM': '#f39c12', 'LOW': '#95a5a6'}
+
+# 고정 상수는 렌더링마다 넘기지 않고 템플릿 전역으로 1회 바인딩
+_REPORT_TMPL.globals.update(
+    medals=["🥇", "🥈", "🥉"],
+    claim_types=_CLAIM_TYPE_LABELS,
+    priority_colors=_PRIORITY_COLORS,
+)
+
 
 class DailyEmailReporter:
     """일일 팩트체크 이메일 리포터"""
-    
+
+    # 제목 정규화용 구두점 제거 테이블 (클래스 로드 시 1회만 생성)
+    _PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
     def __init__(self):
         # 환경변수 로드 (.env 파일 또는 GitHub Actions)
         load_dotenv()
@@ -39,19 +170,45 @@ class DailyEmailReporter:
         self.sender_password = os.getenv('SENDER_PASSWORD')
         self.recipient_email = os.getenv('RECIPIENT_EMAIL')
         
+        # 기사 추출용 공유 HTTP 세션 (keep-alive로 URL마다 TLS 핸드셰이크 반복 방지)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+
         # 모듈 초기화
         self.rss_monitor = RSSMonitor()
-        self.extractor = ArticleExtractor()
+        self.extractor = ArticleExtractor(session=self._http)
         self.detector = ClaimDetector()
         self.scorer = PriorityScorer()
-    
+
+        # SMTP 연결 캐시 (TLS+로그인 핸드셰이크를 전송마다 반복하지 않음)
+        self._smtp = None
+
+        # 이번 실행의 기준 시각 (run_daily_report에서 갱신)
+        self._run_ts = datetime.now()
+
     def run_daily_report(self):
         """일일 리포트 실행"""
+        # 실행 시각은 1회만 계산 (제목/헤더/본문 타임스탬프 일관성 보장)
+        self._run_ts = datetime.now()
+
         print("=" * 70)
-        print(f"일일 팩트체크 리포트 생성 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"일일 팩트체크 리포트 생성 - {self._run_ts.strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 70)
         print()
-        
+
+        try:
+            self._run_daily_report()
+        finally:
+            self._close_smtp()
+
+    def _run_daily_report(self):
+        """일일 리포트 본 처리"""
         # 1. RSS 수집 (수동 모드 체크)
         manual_url = os.getenv('ARTICLE_URL')
         if manual_url:
@@ -71,40 +228,48 @@ class DailyEmailReporter:
             self._send_no_articles_email()
             return
         
-        # 3. 상세 분석
+        # 3. 상세 분석 (본문 추출은 동시 실행으로 I/O 대기 시간 단축)
         print(f"📊 3단계: {len(pending_articles)}개 기사 상세 분석 중...")
+        extracted = self._extract_all(pending_articles)
+
+        # 추출 결과 정리 (실패 건은 RSS 제목만으로 분석)
+        prepared = []
+        for (url, title, source, score), article in zip(pending_articles, extracted):
+            if not article:
+                print(f"  ⚠️ 본문 추출 실패: {url}")
+                article = {
+                    'title': title,
+                    'text': '',
+                    'source': source,
+                    'date': self._run_ts.strftime('%Y-%m-%d'),
+                    'journalist': 'Unknown'
+                }
+
+            print(f"  📄 본문 길이: {len(article.get('text', ''))}자 | 기자: {article.get('journalist', 'Unknown')}")
+            prepared.append((url, title, article))
+
+        # CPU 분석(주장 탐지 + 점수 계산)은 프로세스 풀에서 코어별 병렬 실행
         analyzed_articles = []
-        
-        for url, title, source, score in pending_articles:
-            try:
-                article = self.extractor.extract(url)
-                if not article:
-                    print(f"  ⚠️ 본문 추출 실패: {url}")
-                    article = {
-                        'title': title,
-                        'text': '',
-                        'source': source,
-                        'date': datetime.now().strftime('%Y-%m-%d'),
-                        'journalist': 'Unknown'
-                    }
-                
-                print(f"  📄 본문 길이: {len(article.get('text', ''))}자 | 기자: {article.get('journalist', 'Unknown')}")
-                
-                claims = self.detector.detect(article['text'])
-                has_vague = self.detector.has_vague_source(article['text'])
-                score_result = self.scorer.calculate_score(article, claims, has_vague)
-                
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [pool.submit(_analyze_one, article) for _, _, article in prepared]
+
+            for (url, title, article), future in zip(prepared, futures):
+                try:
+                    claims, score_result = future.result()
+                except Exception as e:
+                    print(f"  ❌ 분석 실패: {e}")
+                    continue
+
                 if manual_url or score_result['should_factcheck']:
                     analyzed_articles.append({
                         'url': url,
                         'article': article,
+                        # 중복 제거 비교용 정규화 제목 (추출 시 1회만 계산)
+                        'norm_title': self._normalize_title(article.get('title', title)),
                         'claims': claims,
                         'score': score_result
                     })
                     print(f"  ✓ {article.get('title', title)[:30]}... ({score_result['total_score']}점)")
-                
-            except Exception as e:
-                print(f"  ❌ 분석 실패: {e}")
         
         # 3.5 중복 제거
         if analyzed_articles:
@@ -112,12 +277,15 @@ class DailyEmailReporter:
             final_articles = self._deduplicate_articles(analyzed_articles)
             print(f"✨ 중복 제거 후: {len(final_articles)}건")
             
-            # 3.6 기자 통계 업데이트 (최종 선정된 기사에 대해서만)
-            for item in final_articles:
-                journalist = item['article'].get('journalist')
-                source = item['article'].get('source')
-                if journalist and journalist != 'Unknown':
-                    self.rss_monitor.update_journalist_stats(journalist, source)
+            # 3.6 기자 통계 업데이트 (최종 선정된 기사에 대해서만, 단일 트랜잭션으로 일괄 처리)
+            pairs = [
+                (item['article'].get('journalist'), item['article'].get('source'))
+                for item in final_articles
+                if item['article'].get('journalist') and item['article'].get('journalist') != 'Unknown'
+            ]
+            if pairs:
+                self.rss_monitor.update_journalist_stats_bulk(pairs)
+                for journalist, source in pairs:
                     print(f"  📈 기자 통계 업데이트: {journalist} ({source})")
         else:
             final_articles = []
@@ -130,47 +298,103 @@ class DailyEmailReporter:
         else:
             print("\nℹ️  상세 분석 결과 팩트체크 대상이 없습니다.")
             self._send_no_articles_email()
-    
+
+    @classmethod
+    def _normalize_title(cls, title):
+        """제목 정규화 (NFKC + 소문자 + 구두점 제거) - 유사도 비교 비용 절감"""
+        return unicodedata.normalize('NFKC', title).lower().translate(cls._PUNCT_TABLE)
+
+    def _get_smtp(self):
+        """인증된 SMTP 연결 반환 (가능하면 기존 연결 재사용)"""
+        if self._smtp is not None:
+            try:
+                status, _ = self._smtp.noop()
+                if status == 250:
+                    return self._smtp
+            except Exception:
+                pass
+            self._close_smtp()
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.sender_email, self.sender_password)
+        self._smtp = server
+        return server
+
+    def _close_smtp(self):
+        """캐시된 SMTP 연결 종료"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def _extract_all(self, pending_articles):
+        """기사 본문 동시 추출
+
+        다운로드는 스레드 풀, trafilatura 파싱은 프로세스 풀에서 수행
+        (ArticleExtractor.extract_batch가 단계 분리와 동시 수 제한을 담당)
+        """
+        return self.extractor.extract_batch([url for url, _, _, _ in pending_articles])
+
     def _deduplicate_articles(self, articles):
-        """기사 중복 제거 및 관련 기사 그룹화"""
-        unique_articles = []
-        skip_indices = set()
-        
+        """기사 중복 제거 및 관련 기사 그룹화
+
+        전체 쌍 비교는 기사 수가 늘면 O(k²)로 커지므로, 토큰을 공유하는
+        제목끼리만 후보 쌍으로 추려낸 뒤(블로킹) RapidFuzz로 확인
+        """
         # 날짜순 정렬 (오래된 기사 우선 = 원본 추정)
         # 날짜 형식이 제각각일 수 있으므로 주의 필요 (여기서는 일단 문자열 정렬)
         sorted_articles = sorted(articles, key=lambda x: x['article']['date'])
-        
-        for i in range(len(sorted_articles)):
-            if i in skip_indices:
-                continue
-                
-            current = sorted_articles[i]
-            group = [current]
-            
-            for j in range(i + 1, len(sorted_articles)):
-                if j in skip_indices:
-                    continue
-                
-                compare = sorted_articles[j]
-                
-                # 제목 유사도 비교
-                similarity = SequenceMatcher(None, current['article']['title'], compare['article']['title']).ratio()
-                
-                if similarity > 0.6:  # 60% 이상 비슷하면 같은 이슈로 간주
-                    group.append(compare)
-                    skip_indices.add(j)
-            
+        titles = [item['norm_title'] for item in sorted_articles]
+
+        # 1) 블로킹: 토큰 역색인으로 후보 쌍 생성 (준선형)
+        buckets = {}
+        for i, title in enumerate(titles):
+            for token in set(title.split()):
+                buckets.setdefault(token, []).append(i)
+
+        candidates = set()
+        for indices in buckets.values():
+            for a in range(len(indices)):
+                for b in range(a + 1, len(indices)):
+                    candidates.add((indices[a], indices[b]))
+
+        # 2) 후보 쌍만 유사도 확인 후 union-find로 그룹화
+        parent = list(range(len(titles)))
+
+        def _find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in candidates:
+            if fuzz.token_set_ratio(titles[i], titles[j]) >= 60:  # 60% 이상 비슷하면 같은 이슈로 간주
+                root_i, root_j = _find(i), _find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        groups = {}
+        for i in range(len(titles)):
+            groups.setdefault(_find(i), []).append(sorted_articles[i])
+
+        unique_articles = []
+        for root in sorted(groups):
+            group = groups[root]
+
             # 그룹 처리
             selected = group[0]  # 가장 빠른 기사
             selected['related_count'] = len(group) - 1
             # 관련 기사 정보 저장 (언론사, 시간, 기자)
             selected['related_info'] = [
-                f"{item['article']['source']} ({item['article'].get('journalist', 'Unknown')})" 
+                f"{item['article']['source']} ({item['article'].get('journalist', 'Unknown')})"
                 for item in group[1:]
             ]
-            
+
             unique_articles.append(selected)
-            
+
         # 최대 5개까지만 리포트
         return unique_articles[:5]
 
@@ -192,30 +416,36 @@ class DailyEmailReporter:
         """팩트체크 리포트 이메일 전송"""
         html_content = self._generate_html_report(articles)
         html_content = self._add_manual_link_footer(html_content)
-        
-        msg = MIMEMultipart('alternative')
-        
+
         if os.getenv('ARTICLE_URL'):
-            msg['Subject'] = f"🔧 수동 팩트체크 리포트 - {datetime.now().strftime('%Y년 %m월 %d일')}"
-            footer_text = "이 리포트는 사용자의 요청에 의해 수동으로 생성되었습니다."
+            subject = f"🔧 수동 팩트체크 리포트 - {self._run_ts.strftime('%Y년 %m월 %d일')}"
         else:
-            msg['Subject'] = f"📊 일일 팩트체크 리포트 - {datetime.now().strftime('%Y년 %m월 %d일')}"
-            footer_text = "이 이메일은 팩트체크 엔진에서 자동으로 발송되었습니다."
+            subject = f"📊 일일 팩트체크 리포트 - {self._run_ts.strftime('%Y년 %m월 %d일')}"
 
-        msg['From'] = self.sender_email
-        msg['To'] = self.recipient_email
-        
-        msg.attach(MIMEText(html_content, 'html', 'utf-8'))
-        
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            self._send_html(subject, html_content)
         except Exception as e:
             print(f"❌ 이메일 전송 실패: {e}")
             raise
-    
+
+    def _send_html(self, subject: str, html_content: str):
+        """HTML 메일 1건 전송
+
+        서버가 8BITMIME을 지원하면 quoted-printable 재인코딩 없이
+        UTF-8 본문을 그대로 보내 대용량 HTML의 인코딩 비용을 줄임
+        """
+        server = self._get_smtp()
+
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = self.sender_email
+        msg['To'] = self.recipient_email
+
+        cte = '8bit' if server.has_extn('8bitmime') else 'quoted-printable'
+        msg.set_content(html_content, subtype='html', charset='utf-8', cte=cte)
+
+        server.send_message(msg)
+
     def _send_no_articles_email(self):
         """팩트체크 대상 없음 이메일 전송"""
         html_content = f"""
@@ -232,7 +462,7 @@ class DailyEmailReporter:
             <div class="container">
                 <div class="header">
                     <h1>📊 일일 팩트체크 리포트</h1>
-                    <p>{datetime.now().strftime('%Y년 %m월 %d일')}</p>
+                    <p>{self._run_ts.strftime('%Y년 %m월 %d일')}</p>
                 </div>
                 <div class="content">
                     <h2>ℹ️ 오늘의 팩트체크 대상 기사</h2>
@@ -245,154 +475,32 @@ class DailyEmailReporter:
         </html>
         """
         html_content = self._add_manual_link_footer(html_content)
-        
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = f"📊 일일 팩트체크 리포트 - {datetime.now().strftime('%Y년 %m월 %d일')} (대상 없음)"
-        msg['From'] = self.sender_email
-        msg['To'] = self.recipient_email
-        
-        msg.attach(MIMEText(html_content, 'html', 'utf-8'))
-        
+
+        subject = f"📊 일일 팩트체크 리포트 - {self._run_ts.strftime('%Y년 %m월 %d일')} (대상 없음)"
+
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            self._send_html(subject, html_content)
             print("✅ '대상 없음' 알림 이메일 전송 완료")
         except Exception as e:
             print(f"❌ 이메일 전송 실패: {e}")
     
     def _generate_html_report(self, articles):
-        """HTML 리포트 생성"""
+        """HTML 리포트 생성 (컴파일된 템플릿을 1회 렌더링)"""
         # 우수 기자 순위 가져오기
         top_journalists = self.rss_monitor.get_top_journalists(limit=3)
-        journalist_table = ""
-        
-        if top_journalists:
-            journalist_rows = ""
-            for i, (name, aff, count) in enumerate(top_journalists, 1):
-                icon = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else str(i)
-                journalist_rows += f"""
-                <tr>
-                    <td style="padding: 8px; border-bottom: 1px solid #eee;">{icon} <strong>{name}</strong> ({aff})</td>
-                    <td style="padding: 8px; border-bottom: 1px solid #eee; text-align: right;">{count}건</td>
-                </tr>
-                """
-        else:
-            journalist_rows = """
-            <tr>
-                <td colspan="2" style="padding: 15px; text-align: center; color: #666;">
-                    🌱 아직 데이터가 충분하지 않습니다.<br>
-                    (오늘부터 기자별 통계가 누적되기 시작합니다!)
-                </td>
-            </tr>
-            """
-            
-        journalist_table = f"""
-        <div style="margin: 20px 0; padding: 15px; background: #fff; border: 1px solid #e1e4e8; border-radius: 8px;">
-            <h3 style="margin-top: 0; margin-bottom: 15px; color: #24292e;">🏆 이달의 팩트체크 기자 (Hall of Fame)</h3>
-            <table style="width: 100%; border-collapse: collapse;">
-                {journalist_rows}
-            </table>
-        </div>
-        """
 
-        articles_html = ""
-        
-        for i, item in enumerate(articles, 1):
-            article = item['article']
-            claims = item['claims']
-            score = item['score']
-            
-            # 관련 기사 표시
-            related_html = ""
-            if item.get('related_count', 0) > 0:
-                related_sources = ', '.join(item['related_info'])
-                related_html = f"""
-                <div style="margin-top: 10px; padding: 10px; background: #f1f8ff; border-radius: 5px; font-size: 13px; color: #0366d6;">
-                    <strong>🔗 관련 보도 ({item['related_count']}건):</strong> {related_sources} 등
-                </div>
-                """
-            
-            # 주장 목록 HTML
-            claims_html = ""
-            for j, claim in enumerate(claims[:3], 1):  # 최대 3개
-                claim_type = {
-                    'statistical': '📊 통계',
-                    'causal': '🔗 인과관계',
-                    'extreme': '⚠️ 극단 표현'
-                }.get(claim['type'], claim['type'])
-                claims_html += f"<li><strong>[{claim_type}]</strong> {claim['claim'][:100]}...<br><small>신뢰도: {claim['confidence']}</small></li>"
-            
-            priority_color = {'HIGH': '#e74c3c', 'MEDIUM': '#f39c12', 'LOW': '#95a5a6'}.get(score['priority'], '#95a5a6')
-            
-            articles_html += f"""
-            <div style="border: 1px solid #ddd; border-radius: 10px; padding: 20px; margin-bottom: 20px; background: #f9f9f9;">
-                <h3 style="margin-top: 0;">[{i}] {article['title']}</h3>
-                <p style="color: #666;">
-                    <strong>언론사:</strong> {article['source']} | 
-                    <strong>기자:</strong> {article.get('journalist', 'Unknown')} |
-                    <strong>발행일:</strong> {article['date']}
-                </p>
-                {related_html}
-                
-                <div style="background: white; padding: 15px; border-radius: 5px; margin: 10px 0;">
-                    <p style="margin: 5px 0;">
-                        <strong>우선순위 점수:</strong> 
-                        <span style="color: {priority_color}; font-size: 20px; font-weight: bold;">{score['total_score']}점</span>
-                        <span style="background: {priority_color}; color: white; padding: 3px 8px; border-radius: 3px; margin-left: 10px;">{score['priority']}</span>
-                    </p>
-                    <p style="margin: 5px 0;"><strong>발견된 주장:</strong> {score['claims_count']}개</p>
-                </div>
-                
-                <h4>🔍 주요 주장</h4>
-                <ul>{claims_html}</ul>
-                <p><a href="{item['url']}" style="background: #3498db; color: white; padding: 10px 15px; text-decoration: none; border-radius: 5px; display: inline-block;">원문 보기 →</a></p>
-            </div>
-            """
-        
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Malgun Gothic', Arial, sans-serif; line-height: 1.6; }}
-                .container {{ max-width: 800px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; text-align: center; }}
-                .summary {{ background: #f0f0f0; padding: 20px; border-radius: 10px; margin: 20px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>📊 일일 팩트체크 리포트</h1>
-                    <p>{datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}</p>
-                </div>
-                
-                <div class="summary">
-                    <h2>📌 오늘의 요약</h2>
-                    <p>
-                        <strong>팩트체크 필요 기사:</strong> {len(articles)}건<br>
-                        <strong>모니터링 상태:</strong> ✅ 정상
-                    </p>
-                </div>
-
-                {journalist_table}
-                
-                <h2>🎯 팩트체크 대상 기사 (최초 보도 우선)</h2>
-                {articles_html}
-                
-                <hr style="margin: 30px 0;">
-                
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return _REPORT_TMPL.render(
+            articles=articles,
+            journalists=top_journalists,
+            now=self._run_ts,
+        )
 
 
 def main():
     """메인 실행"""
+    # rss_monitor 등 logging을 쓰는 단계의 진행 로그가 보이도록 설정
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     reporter = DailyEmailReporter()
     reporter.run_daily_report()
 
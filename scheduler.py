@@ -42,11 +42,15 @@ def main():
     print("🔍 테스트 실행 중...")
     job()
     
-    # 스케줄 실행
+    # 스케줄 실행 (다음 작업 시각까지 통째로 sleep - 1분 폴링 제거)
     print("\n⏰ 스케줄러 대기 중...")
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break  # 남은 작업 없음
+        if idle > 0:
+            time.sleep(idle)
         schedule.run_pending()
-        time.sleep(60)  # 1분마다 체크
 
 
 if __name__ == "__main__":
@@ -3,28 +3,40 @@
 데이터를 시각화하여 반박 자료로 활용합니다.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import pandas as pd
-from pathlib import Path
-from typing import Optional
+from __future__ import annotations
 
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-# 한글 폰트 설정 (Windows 기준)
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ChartGenerator:
     """팩트체크용 차트 생성기"""
-    
+
     def __init__(self, output_dir: str = "output"):
         """
         Args:
             output_dir: 차트 저장 디렉토리
         """
+        # matplotlib은 임포트 비용이 커서 차트를 실제로 만드는 경로에서만 로드
+        # (RSS 수집 등 차트가 필요 없는 실행의 기동 시간 단축)
+        import matplotlib
+        matplotlib.use('Agg')  # 파일 저장 전용 - GUI 백엔드 초기화 생략
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        # 한글 폰트 설정 (Windows 기준)
+        matplotlib.rcParams['font.family'] = 'Malgun Gothic'
+        matplotlib.rcParams['axes.unicode_minus'] = False
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+
+        # Figure는 1개를 만들어 호출 간 재사용 (차트마다 Figure 생성/폐기 방지)
+        self._fig = Figure(figsize=(12, 6))
+        self._canvas = FigureCanvasAgg(self._fig)
     
     def create_tax_vs_rent_chart(
         self,
@@ -43,21 +55,25 @@ class ChartGenerator:
         Returns:
             저장된 파일 경로
         """
-        fig, ax1 = plt.subplots(figsize=(12, 6))
-        
+        self._fig.clf()
+        ax1 = self._fig.subplots()
+
+        # 조 단위 변환은 NumPy 배열로 1회만 계산하고 재사용 (Series 3회 재생성 방지)
+        tax_trillion = tax_data['tax_billion_krw'].to_numpy() / 1000.0
+
         # 왼쪽 Y축: 종부세 (막대 그래프)
         color = 'tab:red'
         ax1.set_xlabel('연도', fontsize=12)
         ax1.set_ylabel('종합부동산세 (조 원)', color=color, fontsize=12)
         bars = ax1.bar(
             tax_data['year'],
-            tax_data['tax_billion_krw'] / 1000,  # 조 단위로 변환
+            tax_trillion,
             color=color,
             alpha=0.6,
             label='종부세 징수액'
         )
         ax1.tick_params(axis='y', labelcolor=color)
-        ax1.set_ylim(0, max(tax_data['tax_billion_krw'] / 1000) * 1.3)
+        ax1.set_ylim(0, tax_trillion.max() * 1.3)
         
         # 오른쪽 Y축: 월세 비중 (선 그래프)
         ax2 = ax1.twinx()
@@ -76,7 +92,7 @@ class ChartGenerator:
         ax2.set_ylim(30, 70)
         
         # 제목 및 범례
-        plt.title(
+        ax1.set_title(
             '[팩트체크] "세금 때문에 월세 올랐다?" → 데이터는 정반대를 말합니다',
             fontsize=14,
             fontweight='bold',
@@ -85,7 +101,7 @@ class ChartGenerator:
         
         # 주석 추가
         ax1.text(
-            2022, max(tax_data['tax_billion_krw'] / 1000) * 1.15,
+            2022, tax_trillion.max() * 1.15,
             '← 세금은 줄었는데',
             fontsize=11,
             color='red',
@@ -99,13 +115,12 @@ class ChartGenerator:
             ha='center'
         )
         
-        fig.tight_layout()
-        
+        self._fig.tight_layout()
+
         # 저장
         output_path = self.output_dir / filename
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
+        self._fig.savefig(output_path, dpi=300, bbox_inches='tight')
+
         return str(output_path)
     
     def create_interest_vs_rent_chart(
@@ -125,8 +140,11 @@ class ChartGenerator:
         Returns:
             저장된 파일 경로
         """
-        fig, ax1 = plt.subplots(figsize=(12, 6))
-        
+        import pandas as pd
+
+        self._fig.clf()
+        ax1 = self._fig.subplots()
+
         # 연도 추출 (YYYY-MM → YYYY)
         interest_data['year'] = pd.to_datetime(interest_data['date']).dt.year
         
@@ -162,19 +180,18 @@ class ChartGenerator:
         ax2.tick_params(axis='y', labelcolor=color)
         ax2.set_ylim(30, 70)
         
-        plt.title(
+        ax1.set_title(
             '[팩트체크] 진짜 범인은 "금리"입니다',
             fontsize=14,
             fontweight='bold',
             pad=20
         )
         
-        fig.tight_layout()
-        
+        self._fig.tight_layout()
+
         output_path = self.output_dir / filename
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
+        self._fig.savefig(output_path, dpi=300, bbox_inches='tight')
+
         return str(output_path)
 
 
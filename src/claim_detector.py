@@ -7,44 +7,62 @@ import re
 from typing import List, Dict
 
 
+# 통계 패턴 (숫자 + 단위 + 주장)
+_STAT_PATTERN_STRS = (
+    r'(\d+(?:\.\d+)?)\s*배\s*(증가|감소|상승|하락)',
+    r'(\d+(?:\.\d+)?)\s*%\s*(증가|감소|상승|하락|돌파)',
+    r'(\d+(?:\.\d+)?)\s*조\s*원',
+    r'(\d+(?:\.\d+)?)\s*억\s*원',
+    r'전년\s*대비\s*(\d+(?:\.\d+)?)\s*%',
+    r'(\d+(?:\.\d+)?)\s*명\s*(증가|감소|사망)',
+    r'(\d+(?:\.\d+)?)\s*건\s*(증가|감소|발생)',
+    r'사상\s*(최대|최고|최저)',
+    r'역대\s*(최대|최고|최저)',
+)
+
+# 인과관계 표현
+# (.+ 류의 무제한 탐욕 수량자는 긴 본문에서 역추적 폭주 위험이 있어
+#  줄 단위 + 200자 상한으로 제한)
+_CAUSAL_PATTERN_STRS = (
+    r'([^\n]{0,200}?)\s*(때문에|탓에)\s*([^\n]{1,200})',
+    r'([^\n]{0,200}?)\s*(영향으로|여파로)\s*([^\n]{1,200})',
+    r'([^\n]{0,200}?)\s*(?:가|이)\s*([^\n]{0,200}?)\s*(?:초래|유발)',
+)
+
+# 극단적 표현
+_EXTREME_WORDS = [
+    '폭증', '급증', '급감', '폭락', '급락',
+    '사상 최대', '사상 최고', '역대 최대', '역대 최고',
+    '기록적', '전례없는', '유례없는'
+]
+
+# 불확실 표현 (출처 불명확)
+_VAGUE_PATTERN_STRS = (
+    r'(?:것으로|인|이)\s*알려졌다',
+    r'(?:것으로|인|이)\s*보인다',
+    r'(?:것으로|인|이)\s*추정된다',
+    r'(?:것으로|인|이)\s*전해졌다',
+)
+
+# 카테고리별로 하나의 얼터네이션으로 합쳐 본문을 카테고리당 1회만 스캔
+# (모듈 로드 시 1회만 컴파일. 세 카테고리를 패턴 하나로 더 합치면
+#  finditer가 매치 뒤에서 재개하면서 같은 구간에 겹치는 다른 카테고리의
+#  주장을 지워 버리므로 카테고리 단위까지만 합친다)
+_STAT_RE = re.compile('|'.join(f'(?:{p})' for p in _STAT_PATTERN_STRS))
+_CAUSAL_RE = re.compile('|'.join(f'(?:{p})' for p in _CAUSAL_PATTERN_STRS))
+_EXTREME_RE = re.compile('|'.join(map(re.escape, _EXTREME_WORDS)))
+_VAGUE_RE = re.compile('|'.join(f'(?:{p})' for p in _VAGUE_PATTERN_STRS))
+
+
 class ClaimDetector:
     """통계적 주장 탐지기"""
-    
+
     def __init__(self):
-        # 통계 패턴 (숫자 + 단위 + 주장)
-        self.stat_patterns = [
-            r'(\d+(?:\.\d+)?)\s*배\s*(증가|감소|상승|하락)',
-            r'(\d+(?:\.\d+)?)\s*%\s*(증가|감소|상승|하락|돌파)',
-            r'(\d+(?:\.\d+)?)\s*조\s*원',
-            r'(\d+(?:\.\d+)?)\s*억\s*원',
-            r'전년\s*대비\s*(\d+(?:\.\d+)?)\s*%',
-            r'(\d+(?:\.\d+)?)\s*명\s*(증가|감소|사망)',
-            r'(\d+(?:\.\d+)?)\s*건\s*(증가|감소|발생)',
-            r'사상\s*(최대|최고|최저)',
-            r'역대\s*(최대|최고|최저)',
-        ]
-        
-        # 인과관계 표현
-        self.causal_patterns = [
-            r'(.+?)\s*(때문에|탓에)\s*(.+)',
-            r'(.+?)\s*(영향으로|여파로)\s*(.+)',
-            r'(.+?)\s*(?:가|이)\s*(.+?)\s*(?:초래|유발)',
-        ]
-        
-        # 극단적 표현
-        self.extreme_words = [
-            '폭증', '급증', '급감', '폭락', '급락',
-            '사상 최대', '사상 최고', '역대 최대', '역대 최고',
-            '기록적', '전례없는', '유례없는'
-        ]
-        
-        # 불확실 표현 (출처 불명확)
-        self.vague_patterns = [
-            r'(?:것으로|인|이)\s*알려졌다',
-            r'(?:것으로|인|이)\s*보인다',
-            r'(?:것으로|인|이)\s*추정된다',
-            r'(?:것으로|인|이)\s*전해졌다',
-        ]
+        self._stat_re = _STAT_RE
+        self._causal_re = _CAUSAL_RE
+        self._extreme_re = _EXTREME_RE
+        self._vague_re = _VAGUE_RE
+        self.extreme_words = _EXTREME_WORDS
     
     def detect(self, text: str) -> List[Dict[str, any]]:
         """
@@ -63,78 +81,41 @@ class ClaimDetector:
             ]
         """
         claims = []
-        
-        # 1. 통계적 주장 탐지
-        for pattern in self.stat_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                # 주변 문맥 추출 (앞뒤 30자)
-                start = max(0, match.start() - 30)
-                end = min(len(text), match.end() + 30)
-                context = text[start:end].strip()
-                
-                claims.append({
-                    'claim': context,
-                    'type': 'statistical',
-                    'confidence': 'HIGH',
-                    'matched_text': match.group(0)
-                })
-        
-        # 2. 인과관계 주장 탐지
-        for pattern in self.causal_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                claims.append({
-                    'claim': match.group(0),
-                    'type': 'causal',
-                    'confidence': 'MEDIUM',
-                    'matched_text': match.group(0)
-                })
-        
-        # 3. 극단적 표현 탐지
-        for word in self.extreme_words:
-            if word in text:
-                # 해당 단어 주변 문맥 추출
-                idx = text.find(word)
-                start = max(0, idx - 30)
-                end = min(len(text), idx + len(word) + 30)
-                context = text[start:end].strip()
-                
-                claims.append({
-                    'claim': context,
-                    'type': 'extreme',
-                    'confidence': 'MEDIUM',
-                    'matched_text': word
-                })
-        
-        # 중복 제거 (유사한 주장)
-        unique_claims = self._deduplicate(claims)
-        
-        return unique_claims
-    
-    def _deduplicate(self, claims: List[Dict]) -> List[Dict]:
-        """유사한 주장 중복 제거"""
-        if not claims:
-            return []
-        
-        unique = []
         seen_texts = set()
-        
-        for claim in claims:
-            # 매칭된 텍스트 기준으로 중복 체크
-            matched = claim['matched_text']
-            if matched not in seen_texts:
+
+        # 카테고리별 합쳐진 패턴으로 스캔 (카테고리당 1회)
+        for claim_type, confidence, pattern in (
+            ('statistical', 'HIGH', self._stat_re),
+            ('causal', 'MEDIUM', self._causal_re),
+            ('extreme', 'MEDIUM', self._extreme_re),
+        ):
+            for match in pattern.finditer(text):
+                # 중복 제거를 스캔 중에 바로 수행 (후처리 재순회 불필요)
+                matched = match.group(0)
+                if matched in seen_texts:
+                    continue
                 seen_texts.add(matched)
-                unique.append(claim)
-        
-        return unique
-    
+
+                if claim_type == 'causal':
+                    claim_text = matched
+                else:
+                    # 주변 문맥 추출 (앞뒤 30자)
+                    start = max(0, match.start() - 30)
+                    end = min(len(text), match.end() + 30)
+                    claim_text = text[start:end].strip()
+
+                claims.append({
+                    'claim': claim_text,
+                    'type': claim_type,
+                    'confidence': confidence,
+                    'matched_text': matched
+                })
+
+        return claims
+
     def has_vague_source(self, text: str) -> bool:
         """출처 불명확 표현 포함 여부"""
-        for pattern in self.vague_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return bool(self._vague_re.search(text))
 
 
 if __name__ == "__main__":
@@ -3,11 +3,15 @@
 정부 공식 통계 API에서 데이터를 가져옵니다.
 """
 
+from __future__ import annotations
+
 import requests
-import pandas as pd
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class KOSISFetcher:
     """국가통계포털(KOSIS) 데이터 수집기"""
@@ -32,6 +36,9 @@ class KOSISFetcher:
         Returns:
             DataFrame with columns: year, jeonse_ratio, monthly_rent_ratio
         """
+        # pandas는 무거워서 실제 데이터를 만들 때만 로드 (기동 시간 단축)
+        import pandas as pd
+
         # TODO: 실제 KOSIS API 호출 구현
         # 현재는 더미 데이터 반환
         data = {
@@ -65,6 +72,8 @@ class BOKFetcher:
         Returns:
             DataFrame with columns: date, mortgage_rate
         """
+        import pandas as pd
+
         # TODO: 실제 ECOS API 호출 구현
         # 현재는 더미 데이터 반환
         data = {
@@ -84,6 +93,8 @@ class BOKFetcher:
         Returns:
             DataFrame with columns: year, debt_trillion_krw
         """
+        import pandas as pd
+
         # TODO: 실제 ECOS API 호출 구현
         data = {
             'year': [2020, 2021, 2022, 2023, 2024],
@@ -106,6 +117,8 @@ class NTSFetcher:
         Returns:
             DataFrame with columns: year, tax_billion_krw
         """
+        import pandas as pd
+
         # TODO: 국세청 통계연보 크롤링 또는 공공데이터 API 활용
         # 현재는 더미 데이터 (실제 추세 반영)
         data = {
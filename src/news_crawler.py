@@ -3,20 +3,50 @@
 주요 뉴스 사이트를 크롤링하여 팩트체크 대상 자동 발견
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lxml import html as lxml_html
 import time
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from article_extractor import ArticleExtractor
+from article_extractor import ArticleExtractor, build_session
 from claim_detector import ClaimDetector
 from priority_scorer import PriorityScorer
 
 
+class _HostRateLimiter:
+    """호스트별 최소 요청 간격 제한기
+
+    요청마다 무조건 sleep하는 대신 같은 호스트에 대한 직전 요청 시각을
+    기록해 간격이 모자랄 때만 모자란 만큼만 대기. 서로 다른 호스트는
+    서로를 막지 않는다.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str):
+        """host에 대한 요청 허가를 받을 때까지 필요한 만큼만 대기"""
+        if self.min_interval <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self.min_interval - (now - self._last.get(host, 0.0))
+                if wait <= 0:
+                    self._last[host] = now
+                    return
+            time.sleep(wait)
+
+
 class NewsCrawler:
     """뉴스 크롤러"""
     
@@ -26,17 +56,22 @@ class NewsCrawler:
         '네이버_뉴스_경제': 'https://news.naver.com/section/101',
     }
     
-    def __init__(self, rate_limit=1.0):
+    def __init__(self, rate_limit=1.0, session=None):
         """
         Args:
-            rate_limit: 요청 간 대기 시간 (초)
+            rate_limit: 같은 호스트에 대한 최소 요청 간격 (초)
+            session: 공유 requests.Session (없으면 자체 풀링 세션 생성)
         """
         self.rate_limit = rate_limit
+        self._limiter = _HostRateLimiter(rate_limit)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        
-        self.extractor = ArticleExtractor()
+
+        # 크롤러와 추출기가 같은 커넥션 풀을 공유 (호스트당 핸드셰이크 1회)
+        self.session = session if session is not None else build_session(self.headers)
+
+        self.extractor = ArticleExtractor(session=self.session)
         self.detector = ClaimDetector()
         self.scorer = PriorityScorer()
     
@@ -48,22 +83,26 @@ class NewsCrawler:
         print()
         
         all_articles = []
-        
-        for site_name, site_url in self.TARGET_SITES.items():
+
+        # 섹션 페이지는 서로 다른 호스트/경로이므로 동시 다운로드 (호스트별 동시 수 제한)
+        sites = list(self.TARGET_SITES.items())
+        responses = self._fetch_sites(sites)
+
+        for (site_name, site_url), response in zip(sites, responses):
             print(f"🕷️  {site_name} 크롤링 중...")
-            
+
             try:
-                articles = self._crawl_naver_section(site_url)
+                if isinstance(response, Exception):
+                    raise response
+                articles = self._parse_naver_section(response)
                 all_articles.extend(articles)
                 print(f"  ✓ {len(articles)}개 기사 URL 수집")
-                
+
             except Exception as e:
                 print(f"  ❌ 크롤링 실패: {e}")
-            
-            # Rate limiting
-            time.sleep(self.rate_limit)
+
             print()
-        
+
         print("=" * 70)
         print(f"총 {len(all_articles)}개 기사 URL 수집 완료")
         print("=" * 70)
@@ -71,77 +110,113 @@ class NewsCrawler:
         
         return all_articles
     
-    def _crawl_naver_section(self, url: str) -> list:
-        """네이버 뉴스 섹션 크롤링"""
+    def _fetch_sites(self, sites):
+        """섹션 페이지 동시 다운로드
+
+        requests는 동기이므로 스레드 풀에서 실행하고, 호스트별
+        Semaphore(4)로 같은 사이트에 대한 동시 요청 수를 제한
+        """
+        async def _gather():
+            loop = asyncio.get_running_loop()
+            host_sems = {}
+
+            async def _fetch(site_url):
+                host = urlparse(site_url).netloc
+                sem = host_sems.setdefault(host, asyncio.Semaphore(4))
+                async with sem:
+                    return await loop.run_in_executor(None, self._get, site_url)
+
+            tasks = [_fetch(site_url) for _, site_url in sites]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        return asyncio.run(_gather())
+
+    def _get(self, url):
+        """호스트별 간격 제한을 지키며 GET (스레드 풀에서 실행)"""
+        self._limiter.acquire(urlparse(url).netloc)
+        return self.session.get(url, headers=self.headers, timeout=10)
+
+    def _parse_naver_section(self, response) -> list:
+        """네이버 뉴스 섹션 페이지에서 기사 링크 추출"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+
             # 기사 링크 추출 (네이버 뉴스 구조에 맞게 조정 필요)
-            article_links = []
-            
-            # 예시: a 태그에서 기사 링크 추출
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if 'news.naver.com' in href and '/article/' in href:
-                    article_links.append(href)
-            
+            # lxml C 레벨 XPath로 href를 바로 뽑아 파이썬 태그 순회 제거
+            tree = lxml_html.fromstring(response.content)
+            hrefs = tree.xpath('//a[contains(@href, "/article/")]/@href')
+            article_links = [href for href in hrefs if 'news.naver.com' in href]
+
             # 중복 제거
             article_links = list(set(article_links))
-            
+
             return article_links[:20]  # 최대 20개만
-            
+
         except Exception as e:
             print(f"  ⚠️  크롤링 오류: {e}")
             return []
     
+    def _analyze_one(self, url: str):
+        """기사 1건 추출 + 주장 탐지 + 점수 계산"""
+        # 기사 추출
+        article = self.extractor.extract(url)
+        if not article:
+            return None
+
+        # 주장 탐지
+        claims = self.detector.detect(article['text'])
+        has_vague = self.detector.has_vague_source(article['text'])
+
+        # 우선순위 계산
+        score_result = self.scorer.calculate_score(article, claims, has_vague)
+
+        return {
+            'url': url,
+            'article': article,
+            'claims': claims,
+            'score': score_result
+        }
+
     def analyze_articles(self, article_urls: list, max_analyze=5):
-        """수집된 기사 분석"""
+        """수집된 기사 분석 (추출은 I/O 대기가 대부분이라 스레드 풀로 병렬 처리)"""
         print()
         print("📊 기사 분석 시작")
         print("-" * 70)
         print()
-        
+
+        targets = article_urls[:max_analyze]
         high_priority_articles = []
-        
-        for i, url in enumerate(article_urls[:max_analyze], 1):
-            print(f"[{i}/{min(max_analyze, len(article_urls))}] 분석 중...")
-            
-            try:
-                # 기사 추출
-                article = self.extractor.extract(url)
-                if not article:
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self._analyze_one, url) for url in targets]
+
+            for i, (url, future) in enumerate(zip(targets, futures), 1):
+                print(f"[{i}/{len(targets)}] 분석 중...")
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"  ❌ 분석 실패: {e}")
+                    print()
+                    continue
+
+                if result is None:
                     print(f"  ❌ 추출 실패: {url}")
+                    print()
                     continue
-                
-                # 주장 탐지
-                claims = self.detector.detect(article['text'])
-                has_vague = self.detector.has_vague_source(article['text'])
-                
-                # 우선순위 계산
-                score_result = self.scorer.calculate_score(article, claims, has_vague)
-                
+
+                article = result['article']
+                score_result = result['score']
+
                 print(f"  ✓ {article['title'][:40]}...")
                 print(f"    점수: {score_result['total_score']}점 | 우선순위: {score_result['priority']}")
-                
+
                 if score_result['should_factcheck']:
-                    high_priority_articles.append({
-                        'url': url,
-                        'article': article,
-                        'claims': claims,
-                        'score': score_result
-                    })
+                    high_priority_articles.append(result)
                     print(f"    🎯 팩트체크 대상!")
-                
-            except Exception as e:
-                print(f"  ❌ 분석 실패: {e}")
-            
-            # Rate limiting
-            time.sleep(self.rate_limit)
-            print()
-        
+
+                print()
+
         print("-" * 70)
         print(f"✅ 분석 완료: {len(high_priority_articles)}개 팩트체크 대상 발견")
         print()
@@ -3,6 +3,7 @@
 팩트체크 필요도를 점수화
 """
 
+import re
 from typing import Dict, List
 
 
@@ -19,18 +20,26 @@ class PriorityScorer:
     }
     
     THRESHOLD = 30  # 팩트체크 대상 임계값
-    
+
+    # 제목 키워드 보너스 (강한 어조)
+    _TITLE_KW_RE = re.compile('증가|감소|폭증|급증|하락|최대|최저|역대')
+
     def __init__(self):
         self.political_keywords = [
             '정부', '정책', '국회', '대통령', '장관',
             '여당', '야당', '선거', '법안'
         ]
-        
+
         self.economic_keywords = [
             '경제', 'GDP', '성장률', '물가', '금리',
             '부채', '세금', '월세', '전세', '주택',
             '실업', '고용', '임금', '소득'
         ]
+
+        # 키워드 20여 개를 단일 얼터네이션으로 합쳐 텍스트를 1회만 스캔
+        self._kw_re = re.compile(
+            '|'.join(map(re.escape, self.political_keywords + self.economic_keywords))
+        )
     
     def calculate_score(
         self, 
@@ -56,24 +65,32 @@ class PriorityScorer:
         """
         score = 0
         breakdown = {}
-        
+
+        # 주장 유형별 집계 (리스트 3번 순회 대신 한 번의 순회로 계산)
+        stat_count = causal_count = extreme_count = 0
+        for claim in claims:
+            claim_type = claim['type']
+            if claim_type == 'statistical':
+                stat_count += 1
+            elif claim_type == 'causal':
+                causal_count += 1
+            elif claim_type == 'extreme':
+                extreme_count += 1
+
         # 1. 통계 주장 포함 여부
-        stat_claims = [c for c in claims if c['type'] == 'statistical']
-        if stat_claims:
+        if stat_count:
             points = self.WEIGHTS['statistical_claim']
             score += points
             breakdown['statistical_claim'] = points
-        
+
         # 2. 인과관계 주장
-        causal_claims = [c for c in claims if c['type'] == 'causal']
-        if causal_claims:
+        if causal_count:
             points = self.WEIGHTS['causal_claim']
             score += points
             breakdown['causal_claim'] = points
-        
+
         # 3. 극단적 표현
-        extreme_claims = [c for c in claims if c['type'] == 'extreme']
-        if extreme_claims:
+        if extreme_count:
             points = self.WEIGHTS['extreme_language']
             score += points
             breakdown['extreme_language'] = points
@@ -84,16 +101,16 @@ class PriorityScorer:
             score += points
             breakdown['vague_source'] = points
         
-        # 5. 정치/경제 이슈
-        text = article.get('text', '') + ' ' + article.get('title', '')
-        if self._is_political_or_economic(text):
+        # 5. 정치/경제 이슈 (짧은 제목을 먼저 확인해 본문 전체 스캔/문자열 결합 회피)
+        title = article.get('title', '')
+        if self._is_political_or_economic(title) or \
+                self._is_political_or_economic(article.get('text', '')):
             points = self.WEIGHTS['political_economic']
             score += points
             breakdown['political_economic'] = points
-        
+
         # 6. 제목 키워드 보너스 (강한 어조)
-        title = article.get('title', '')
-        if any(kw in title for kw in ['증가', '감소', '폭증', '급증', '하락', '최대', '최저', '역대']):
+        if self._TITLE_KW_RE.search(title):
             points = 20
             score += points
             breakdown['title_keyword'] = points
@@ -114,24 +131,14 @@ class PriorityScorer:
             'should_factcheck': should_factcheck,
             'priority': priority,
             'claims_count': len(claims),
-            'statistical_claims': len(stat_claims),
-            'causal_claims': len(causal_claims),
-            'extreme_claims': len(extreme_claims)
+            'statistical_claims': stat_count,
+            'causal_claims': causal_count,
+            'extreme_claims': extreme_count
         }
     
     def _is_political_or_economic(self, text: str) -> bool:
-        """정치/경제 관련 기사 여부"""
-        # 정치 키워드 체크
-        for keyword in self.political_keywords:
-            if keyword in text:
-                return True
-        
-        # 경제 키워드 체크
-        for keyword in self.economic_keywords:
-            if keyword in text:
-                return True
-        
-        return False
+        """정치/경제 관련 기사 여부 (합쳐진 패턴으로 1회 스캔)"""
+        return bool(self._kw_re.search(text))
 
 
 if __name__ == "__main__":
@@ -3,17 +3,19 @@ RSS 모니터링 모듈 (Option A)
 주요 언론사 RSS 피드를 수집하고 팩트체크 대상 필터링
 """
 
-import feedparser
+import asyncio
+import logging
+import re
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from article_extractor import ArticleExtractor
-from claim_detector import ClaimDetector
-from priority_scorer import PriorityScorer
+# print는 줄마다 stdout flush(syscall)를 유발하므로 버퍼링되는 logging 사용
+logger = logging.getLogger(__name__)
 
 
 class RSSMonitor:
@@ -32,13 +34,55 @@ class RSSMonitor:
         '세금', '월세', '전세', '부동산', '응급실', '사망',
         '경제성장률', 'GDP', '부채', '금리', '물가'
     ]
-    
+
+    # 키워드별 in 검색 대신 단일 얼터네이션으로 텍스트를 1회만 스캔
+    # (클래스 로드 시 1회만 컴파일)
+    _KW_RE = re.compile('|'.join(map(re.escape, KEYWORDS)))
+    _DELTA_RE = re.compile('증가|감소|폭증|급증')
+    _SURVEY_RE = re.compile('통계|조사|발표')
+
+    # 행 적재분을 플러시하는 단위 (트랜잭션 크기를 적정선으로 유지)
+    _FLUSH_EVERY = 500
+
+    _INSERT_SQL = '''
+        INSERT OR IGNORE INTO articles
+        (url, title, source, published_date, collected_date, priority_score, should_factcheck)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+
     def __init__(self, db_path='data/articles.db'):
+        # 분석 모듈은 trafilatura/lxml까지 끌고 들어와 임포트가 무거우므로
+        # 모듈 로드가 아니라 모니터 생성 시점에만 로드
+        # (get_pending_articles만 쓰는 소비자는 rss_monitor 임포트가 가벼워짐)
+        from article_extractor import ArticleExtractor, build_session
+        from claim_detector import ClaimDetector
+        from priority_scorer import PriorityScorer
+
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
-        
-        self.extractor = ArticleExtractor()
+
+        # 메서드 호출마다 connect/스키마 파싱을 반복하지 않도록 연결 1개를
+        # 인스턴스 수명 동안 재사용. 피드 다운로드만 스레드로 나가고
+        # DB 접근은 _db_lock으로 직렬화
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+
+        # WAL은 DB 파일에 영구 설정되지만 나머지 PRAGMA는 연결별이라 재적용
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-20000')
+
+        # User-Agent 설정 (네이버 차단 방지)
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+
+        # 피드 호스트는 매번 같으므로(news.google.com) 커넥션 풀 세션을
+        # 인스턴스 수명 동안 재사용 - 요청마다 TCP/TLS 핸드셰이크 제거
+        self.session = build_session(self.headers)
+
+        self.extractor = ArticleExtractor(session=self.session)
         self.detector = ClaimDetector()
         self.scorer = PriorityScorer()
     
@@ -70,180 +114,321 @@ class RSSMonitor:
             )
         ''')
         
+        # 피드별 조건부 GET용 검증자 저장소 (ETag/Last-Modified)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                feed_url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT
+            )
+        ''')
+
+        # get_pending_articles 전용 부분 인덱스: 대기 중인 행만 점수순으로
+        # 담고 있어 전체 테이블 스캔 + 정렬 없이 인덱스만 훑으면 된다
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_pending
+            ON articles(priority_score DESC)
+            WHERE should_factcheck = 1 AND analyzed = 0
+        ''')
+
+        # WAL: 커밋마다 전체 fsync를 기다리지 않고 리더/라이터가 서로를
+        # 막지 않는다 (DB 파일에 영구 설정됨). synchronous=NORMAL이면
+        # 커밋된 트랜잭션의 일관성은 유지하되 fsync 횟수가 줄어든다.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-20000')
+
         conn.commit()
         conn.close()
-    
+
     def collect_feeds(self):
-        """RSS 피드 수집"""
-        print("=" * 70)
-        print(f"RSS 피드 수집 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70)
-        print()
+        """RSS 피드 수집 (동기 래퍼 - 기존 호출부 호환)"""
+        return asyncio.run(self.collect_feeds_async())
+
+    async def collect_feeds_async(self):
+        """RSS 피드 수집
+
+        다운로드는 이벤트 루프에서 동시에 진행하고 파싱/저장은 메인
+        태스크에서 처리 (SQLite 접근을 단일 태스크로 유지). 피드 수가
+        늘어도 피드당 스레드를 만들지 않고 executor 풀 크기로 동시 수를
+        제어한다.
+        """
+        # 수집 시각은 실행당 1회만 포맷 (행마다 now()+strftime 호출 제거)
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        today_str = now_str[:10]
+
+        logger.info("=" * 70)
+        logger.info("RSS 피드 수집 시작 - %s", now_str)
+        logger.info("=" * 70)
+        logger.info("")
         
         total_articles = 0
         keyword_matched = 0
         high_priority = 0
+        inserted = 0
+        to_insert = []
+
+        # 기존 URL을 실행당 1회만 읽어 두고 중복은 INSERT 전에 메모리에서
+        # 걸러낸다 - 연속 실행 시 피드 대부분이 재수집분이라 행마다
+        # UNIQUE 인덱스 프로브를 하는 것보다 훨씬 싸다
+        # (수만 건 규모에선 plain set으로 충분, 최종 방어선은 여전히 OR IGNORE)
+        seen = {url for (url,) in self._conn.execute('SELECT url FROM articles')}
         
-        # User-Agent 설정 (네이버 차단 방지)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
-        import requests
-        
-        for feed_name, feed_url in self.RSS_FEEDS.items():
-            print(f"📡 {feed_name} 수집 중...")
-            
+        # requests는 동기이므로 run_in_executor로 감싸 동시에 다운로드
+        # - 전체 대기 시간이 피드별 시간의 합에서 가장 느린 피드 1개
+        #   수준으로 줄어든다
+        feeds = tuple(self.RSS_FEEDS.items())
+
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.run_in_executor(None, self._fetch_feed, feed_url)
+            for _, feed_url in feeds
+        ]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for (feed_name, _), response in zip(feeds, responses):
+            logger.info("📡 %s 수집 중...", feed_name)
+
             try:
-                # requests로 먼저 데이터 가져오기
-                response = requests.get(feed_url, headers=headers, timeout=10)
-                response.raise_for_status()
-                
-                # feedparser로 파싱
-                feed = feedparser.parse(response.text)
-                articles = feed.entries
-                
-                print(f"  ✓ {len(articles)}개 기사 발견")
-                total_articles += len(articles)
-                
-                for entry in articles:
+                if isinstance(response, Exception):
+                    raise response
+
+                # 조건부 GET 재검증 성공 - 새 항목 없음, 파싱 생략
+                if response.status_code == 304:
+                    logger.info("  ✓ 변경 없음 (304)")
+                    logger.info("")
+                    continue
+
+                entries = self._parse_entries(response.content, today_str)
+
+                logger.info("  ✓ %d개 기사 발견", len(entries))
+                total_articles += len(entries)
+
+                for title, url, summary, published in entries:
                     # 키워드 필터링
-                    title = entry.get('title', '')
-                    summary = entry.get('summary', '')
-                    
                     if self._has_keyword(title + ' ' + summary):
                         keyword_matched += 1
-                        
-                        # DB에 저장
-                        url = entry.get('link', '')
-                        published = entry.get('published', datetime.now().strftime('%Y-%m-%d'))
-                        
-                        if self._save_article(url, title, feed_name, published):
+
+                        if url in seen:
+                            continue
+                        seen.add(url)
+
+                        # 저장할 행 적재 (실제 INSERT는 아래에서 일괄 수행)
+                        row, should_factcheck = self._build_row(
+                            url, title, feed_name, published, now_str)
+                        to_insert.append(row)
+                        if should_factcheck:
                             high_priority += 1
-                
+
+                        # 대량 실행에서도 적재 리스트가 무한정 크지 않도록
+                        # 500행 단위로 끊어 플러시
+                        if len(to_insert) >= self._FLUSH_EVERY:
+                            inserted += self._flush_rows(to_insert)
+
             except Exception as e:
-                print(f"  ❌ 수집 실패: {e}")
-            
-            print()
-        
-        print("=" * 70)
-        print("수집 완료")
-        print(f"  • 총 기사: {total_articles}개")
-        print(f"  • 키워드 매칭: {keyword_matched}개")
-        print(f"  • 팩트체크 대상: {high_priority}개")
-        print("=" * 70)
-        print()
+                logger.error("  ❌ 수집 실패: %s", e)
+
+            logger.info("")
+
+        # 남은 적재분 플러시 (행마다 connect+commit 시 fsync가 행 수만큼 발생)
+        if to_insert:
+            inserted += self._flush_rows(to_insert)
+
+        logger.info("=" * 70)
+        logger.info("수집 완료")
+        logger.info("  • 총 기사: %d개", total_articles)
+        logger.info("  • 키워드 매칭: %d개", keyword_matched)
+        logger.info("  • 신규 저장: %d개", inserted)
+        logger.info("  • 팩트체크 대상: %d개", high_priority)
+        logger.info("=" * 70)
+        logger.info("")
     
+    def _flush_rows(self, rows) -> int:
+        """적재된 행을 트랜잭션 1개로 일괄 INSERT하고 리스트를 비운다
+
+        url UNIQUE 제약 + OR IGNORE가 SELECT 선조회 없이 중복을 걸러준다
+
+        Returns:
+            OR IGNORE를 통과한 신규 행 수 (중복 재수집분 제외)
+        """
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.executemany(self._INSERT_SQL, rows)
+            inserted = cursor.rowcount
+            self._conn.commit()
+
+        rows.clear()
+        return inserted
+
+    @staticmethod
+    def _parse_entries(content: bytes, today_str: str):
+        """피드에서 (제목, 링크, 요약, 발행일) 4개 필드만 추출
+
+        feedparser는 항목마다 날짜 struct_time 변환/저자 파싱 등 여기서
+        전부 버리는 정규화를 수행한다. 표준 RSS(구글 뉴스 포함)는 lxml로
+        필요한 필드만 바로 뽑고, 비표준 피드만 feedparser로 폴백
+        """
+        try:
+            from lxml import etree
+
+            root = etree.fromstring(content)
+            entries = [
+                (item.findtext('title') or '',
+                 item.findtext('link') or '',
+                 item.findtext('description') or '',
+                 item.findtext('pubDate') or today_str)
+                for item in root.iterfind('.//item')
+            ]
+            if entries:
+                return entries
+        except Exception:
+            pass
+
+        # 폴백: Atom 등 item 요소가 없는 피드는 feedparser가 처리
+        import feedparser
+
+        feed = feedparser.parse(content)
+        return [
+            (entry.get('title', ''), entry.get('link', ''),
+             entry.get('summary', ''), entry.get('published', today_str))
+            for entry in feed.entries
+        ]
+
+    def _fetch_feed(self, feed_url: str):
+        """피드 1건 다운로드 (스레드 풀에서 실행, 공유 세션으로 keep-alive 재사용)
+
+        직전 응답의 ETag/Last-Modified로 조건부 GET을 보낸다.
+        짧은 폴링 주기에선 피드 미변경이 일반적이라 304(수백 바이트)가
+        전체 XML 재전송을 대체한다.
+        """
+        headers = {}
+        with self._db_lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified FROM feed_cache WHERE feed_url = ?',
+                (feed_url,)
+            ).fetchone()
+        if row:
+            if row[0]:
+                headers['If-None-Match'] = row[0]
+            if row[1]:
+                headers['If-Modified-Since'] = row[1]
+
+        response = self.session.get(feed_url, headers=headers, timeout=10)
+
+        # 304: 변경 없음 - 호출부에서 파싱을 건너뛴다
+        if response.status_code == 304:
+            return response
+
+        response.raise_for_status()
+
+        # 새 검증자를 저장해 다음 실행의 조건부 GET에 사용
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._db_lock:
+                self._conn.execute('''
+                    INSERT OR REPLACE INTO feed_cache (feed_url, etag, last_modified)
+                    VALUES (?, ?, ?)
+                ''', (feed_url, etag, last_modified))
+                self._conn.commit()
+
+        return response
+
     def _has_keyword(self, text: str) -> bool:
-        """키워드 포함 여부"""
-        for keyword in self.KEYWORDS:
-            if keyword in text:
-                return True
-        return False
+        """키워드 포함 여부 (합쳐진 패턴으로 1회 스캔)"""
+        return bool(self._KW_RE.search(text))
     
-    def _save_article(self, url: str, title: str, source: str, published: str) -> bool:
-        """기사 저장 및 우선순위 계산"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            # 중복 체크
-            cursor.execute('SELECT id FROM articles WHERE url = ?', (url,))
-            if cursor.fetchone():
-                return False
-            
-            # 간단한 우선순위 계산 (제목만으로)
-            # 실제 본문 분석은 나중에 별도로 수행
-            score = 0
-            if any(kw in title for kw in ['증가', '감소', '폭증', '급증']):
-                score += 30
-            if any(kw in title for kw in ['통계', '조사', '발표']):
-                score += 20
-            
-            should_factcheck = score >= 30
-            
-            cursor.execute('''
-                INSERT INTO articles (url, title, source, published_date, collected_date, priority_score, should_factcheck)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (url, title, source, published, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), score, should_factcheck))
-            
-            conn.commit()
-            return should_factcheck
-            
-        except sqlite3.IntegrityError:
-            return False
-        finally:
-            conn.close()
+    def _build_row(self, url: str, title: str, source: str, published: str,
+                   collected_date: str):
+        """저장용 행 생성 및 우선순위 계산 (DB 접근 없음)
+
+        Returns:
+            (INSERT용 행 튜플, should_factcheck)
+        """
+        # 간단한 우선순위 계산 (제목만으로)
+        # 실제 본문 분석은 나중에 별도로 수행
+        score = (30 * bool(self._DELTA_RE.search(title))
+                 + 20 * bool(self._SURVEY_RE.search(title)))
+
+        should_factcheck = score >= 30
+
+        row = (url, title, source, published, collected_date, score, should_factcheck)
+        return row, should_factcheck
     
     def get_pending_articles(self, limit=10):
         """분석 대기 중인 기사 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        cursor = self._conn.execute('''
             SELECT url, title, source, priority_score
             FROM articles
             WHERE should_factcheck = 1 AND analyzed = 0
             ORDER BY priority_score DESC
             LIMIT ?
         ''', (limit,))
-        
-        articles = cursor.fetchall()
-        conn.close()
-        
-        return articles
+
+        return cursor.fetchall()
     
     def update_journalist_stats(self, name: str, affiliation: str):
         """기자 통계 업데이트"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
             today = datetime.now().strftime('%Y-%m-%d')
-            
-            # 기자 존재 여부 확인
-            cursor.execute('SELECT total_selected FROM journalists WHERE name = ?', (name,))
-            row = cursor.fetchone()
-            
-            if row:
-                # 존재하면 카운트 증가
-                cursor.execute('''
-                    UPDATE journalists 
-                    SET total_selected = total_selected + 1, last_selected_date = ? 
-                    WHERE name = ?
-                ''', (today, name))
-            else:
-                # 없으면 신규 등록
-                cursor.execute('''
+
+            with self._db_lock:
+                self._conn.execute('''
                     INSERT INTO journalists (name, affiliation, total_selected, last_selected_date)
                     VALUES (?, ?, 1, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        total_selected = total_selected + 1,
+                        last_selected_date = excluded.last_selected_date
                 ''', (name, affiliation, today))
-            
-            conn.commit()
+                self._conn.commit()
+        except Exception as e:
+            logger.error("❌ 기자 통계 업데이트 실패: %s", e)
+
+    def update_journalist_stats_bulk(self, pairs):
+        """기자 통계 일괄 업데이트 (단일 트랜잭션, 행당 왕복 제거)
+
+        Args:
+            pairs: [(기자명, 언론사), ...]
+        """
+        if not pairs:
+            return
+
+        try:
+            today = datetime.now().strftime('%Y-%m-%d')
+
+            with self._db_lock:
+                self._conn.executemany('''
+                    INSERT INTO journalists (name, affiliation, total_selected, last_selected_date)
+                    VALUES (?, ?, 1, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        total_selected = total_selected + 1,
+                        last_selected_date = excluded.last_selected_date
+                ''', [(name, affiliation, today) for name, affiliation in pairs])
+                self._conn.commit()
         except Exception as e:
-            print(f"❌ 기자 통계 업데이트 실패: {e}")
-        finally:
-            conn.close()
+            logger.error("❌ 기자 통계 업데이트 실패: %s", e)
 
     def get_top_journalists(self, limit=3):
         """우수 기자 순위 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT name, affiliation, total_selected 
-            FROM journalists 
-            ORDER BY total_selected DESC, last_selected_date DESC 
+        cursor = self._conn.execute('''
+            SELECT name, affiliation, total_selected
+            FROM journalists
+            ORDER BY total_selected DESC, last_selected_date DESC
             LIMIT ?
         ''', (limit,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        return results
+
+        return cursor.fetchall()
+
+    def close(self):
+        """DB 연결 정리"""
+        self._conn.close()
 
 
 def main():
     """메인 실행"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     monitor = RSSMonitor()
     monitor.collect_feeds()
     